@@ -2,7 +2,7 @@ import os
 import sys
 from unittest.mock import patch
 
-from inverted_index import main, process_build, process_query
+from inverted_index import InvertedIndex, main, process_build, process_query
 
 PATH_TO_JSON_INDEX = "./output_files/inverted.index"
 PATH_TO_STOPWORDS = "./input_files/stop_words_en.txt"
@@ -11,6 +11,7 @@ PATH_TO_DATASET = "./input_files/wikipedia_sample"
 
 
 def test_process_build_inverted_indexes():
+    os.makedirs(os.path.dirname(PATH_TO_JSON_INDEX), exist_ok=True)
     if os.path.exists(PATH_TO_JSON_INDEX):
         os.remove(PATH_TO_JSON_INDEX)
 
@@ -34,6 +35,30 @@ def test_process_query_can_process_all_queries_from_file(capsys):
             assert value in captured.out
 
 
+def test_varint_postings_roundtrip():
+    from inverted_index import _decode_postings, _encode_postings
+
+    doc_ids = [0, 1, 127, 128, 300, 5000, 2**31]
+    assert list(_decode_postings(_encode_postings(doc_ids))) == doc_ids
+    assert _encode_postings([]) == b""
+    assert list(_decode_postings(b"")) == []
+
+
+def test_mmap_index_roundtrip(tmp_path):
+    index = InvertedIndex({"python": [5, 1], "code": [2]})
+    base_path = str(tmp_path / "inverted")
+
+    index.dump_mmap(base_path)
+    loaded = InvertedIndex.open_mmap(base_path)
+
+    assert sorted(loaded.query(["python", "code"])) == [1, 2, 5]
+    assert loaded.query(["missing"]) == []
+
+    loaded.dump(str(tmp_path / "inverted.index"))
+    reloaded = InvertedIndex.load(str(tmp_path / "inverted.index"))
+    assert sorted(reloaded.query(["python", "code"])) == [1, 2, 5]
+
+
 def test_std_argv_input_query(capsys):
     with patch.object(sys, "argv", ["prog", "query", "--query", "python", "code"]):
         main()